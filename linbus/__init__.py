@@ -6,16 +6,20 @@ __all__ = [
     'Message',
     'BusABC',
     'LinBus',
+    'InterfaceNotImplementedError',
     'VectorInitializationError',
     'VectorError'   
 ]
 
-from . import interfaces
+from typing import Any, Dict
 
 from .message import Message
 from .bus import BusABC
-from .interface import LinBus
+from .interface import InterfaceNotImplementedError, LinBus
+
+# The backends import Message and BusABC from this package, so load them last
+from . import interfaces
 
-from .vector.exceptions import VectorInitializationError,VectorError
+from .interfaces.vector.exceptions import VectorInitializationError,VectorError
 
 rc: Dict[str, Any] = {}
\ No newline at end of file
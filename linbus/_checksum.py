@@ -0,0 +1,26 @@
+"""
+LIN frame checksum shared by :class:`~linbus.message.LINPDU`,
+:class:`~linbus.message.LINPDUBatch` and the slave.
+"""
+
+from typing import Union
+
+
+def lin_checksum(pid: int, data: Union[bytes, bytearray, memoryview], enhanced: bool = True) -> int:
+    """
+    Calculate the LIN checksum of a frame.
+
+    Args:
+        pid: Protected ID of the frame, only added for the enhanced checksum.
+        data: Data bytes of the frame, at most 8.
+        enhanced: True for the enhanced (LIN 2.x) checksum, which includes the
+            PID, False for the classic (LIN 1.x) checksum over the data only.
+
+    Returns:
+        The inverted 8-bit sum with carries folded back in.
+    """
+    checksum = sum(data) + pid if enhanced else sum(data)
+    # Fold the carries back in, two folds cover PID + 8 data bytes
+    checksum = (checksum & 0xFF) + (checksum >> 8)
+    checksum = (checksum & 0xFF) + (checksum >> 8)
+    return (~checksum) & 0xFF
@@ -0,0 +1,53 @@
+"""
+LIN protected identifier (PID) lookup shared by the LDF builder, the slave
+and :class:`~linbus.message.LINPDU`.
+"""
+
+from typing import Iterator
+
+# Frame ID bits covered by each parity bit
+_P0_MASK = 0x17  # ID0, ID1, ID2, ID4
+_P1_MASK = 0x3A  # ID1, ID3, ID4, ID5
+
+
+def _compute_pid_lut() -> Iterator[int]:
+    """Yield the Protected ID for each of the 64 LIN Frame IDs, in ID order."""
+    for i in range(64):
+        # P0 = ID0 ^ ID1 ^ ID2 ^ ID4 is the parity of the bits in 0x17,
+        # P1 = ~(ID1 ^ ID3 ^ ID4 ^ ID5) the inverted parity of the bits in 0x3A.
+        # bin().count() instead of int.bit_count(), which needs Python 3.10.
+        p0 = bin(i & _P0_MASK).count("1") & 0x01
+        p1 = (bin(i & _P1_MASK).count("1") & 0x01) ^ 0x01
+        yield i | (p0 << 6) | (p1 << 7)
+
+
+# Protected ID for every 6-bit Frame ID, computed once at import.
+# Kept as bytes: the 64 entries sit in one contiguous buffer and indexing
+# returns a small int without touching per-entry int objects.
+PID_LUT: bytes = bytes(_compute_pid_lut())
+
+
+def pid_of(frame_id: int) -> int:
+    """
+    Get the protected ID for a frame ID.
+
+    Args:
+        frame_id: LIN frame ID, only the lower 6 bits are used.
+
+    Returns:
+        The frame ID with its two parity bits set.
+    """
+    return PID_LUT[frame_id & 0x3F]
+
+
+def check_pid(pid: int) -> bool:
+    """
+    Check the parity bits of a protected ID.
+
+    Args:
+        pid: Protected ID as received on the bus.
+
+    Returns:
+        True if the parity bits match the frame ID.
+    """
+    return PID_LUT[pid & 0x3F] == pid
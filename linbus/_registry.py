@@ -0,0 +1,75 @@
+"""LIN Bus Backend Registry
+
+This module holds the table of known LIN hardware interfaces and the loader
+that resolves an interface name to its bus class. It is private; the public
+entry point is :class:`linbus.interface.LinBus`.
+"""
+import functools
+import importlib
+import sys
+from typing import Any, Dict, Optional, Type, cast
+from can import CanInterfaceNotImplementedError
+from .bus import BusABC
+
+class InterfaceNotImplementedError(CanInterfaceNotImplementedError):
+    """Raised when a registered LIN interface cannot be imported."""
+
+# Dictionary mapping interface names to the bus class implementing them
+# Format: interface_name => "module_path:class_name"
+BACKENDS: Dict[str, str] = {
+    "vector": "linbus.interfaces.vector:VectorLinBus",
+}
+
+def _cached_import(module_name: str, class_name: str) -> Any:
+    """Returns the attribute ``class_name`` of the module ``module_name``.
+
+    The import machinery is only entered if the module is not yet present
+    in :data:`sys.modules`.
+    """
+    modules = sys.modules
+    if module_name not in modules:
+        importlib.import_module(module_name)
+    return getattr(modules[module_name], class_name)
+
+@functools.lru_cache(maxsize=None)
+def _get_class_for_interface(interface: Optional[str]) -> Type[BusABC]:
+    """Dynamically loads and returns the appropriate bus class for the specified interface.
+
+    This function implements a plugin-like system for LIN interfaces by dynamically
+    importing the required module and class based on the interface name.
+    The result is memoized per interface name; call
+    ``_get_class_for_interface.cache_clear()`` to force a fresh lookup.
+
+    Args:
+        interface: Name of the interface to load (must be a key in BACKENDS).
+                   If None and only one backend is registered, that backend is used.
+
+    Returns:
+        The bus class for the specified interface
+
+    Raises:
+        NotImplementedError: If the requested interface is not registered in BACKENDS
+        InterfaceNotImplementedError: If there are problems importing the interface module or class
+    """
+    # Look up the module and class names for the requested interface
+    spec = BACKENDS.get(interface)
+    if spec is None:
+        if interface is None and len(BACKENDS) == 1:
+            # Fall back to the only registered backend
+            spec = next(iter(BACKENDS.values()))
+        else:
+            raise NotImplementedError(
+                f"Lin interface '{interface}' not supported"
+            )
+    module_name, _, class_name = spec.partition(":")
+
+    # Dynamically import the interface module and get the interface class from it
+    try:
+        bus_class = _cached_import(module_name, class_name)
+    except Exception as e:
+        raise InterfaceNotImplementedError(
+            f"Cannot import class {class_name} from module {module_name} for Lin interface "
+            f"'{interface}': {e}"
+        ) from None
+
+    return cast(Type[BusABC], bus_class)
@@ -2,12 +2,11 @@
 Contains the ABC bus implementation and its documentation.
 """
 
-from typing import *
+from typing import Iterator, Optional, Sequence, Tuple, Union
 
-from abc import ABC, ABCMeta, abstractmethod
+from abc import ABCMeta, abstractmethod
 import logging
-import threading
-from time import time
+from time import monotonic
 
 # from can.broadcastmanager import ThreadBasedCyclicSendTask, CyclicSendTaskABC
 from .message import Message
@@ -18,11 +17,21 @@ LOG = logging.getLogger(__name__)
 class BusABC(metaclass=ABCMeta):
     """The Lin Bus Abstract Base Class that serves as the basis
     for all concrete interfaces.
+
+    The base class only declares :obj:`~object.__slots__` for its own
+    bookkeeping, so it adds no per-instance ``__dict__``. Concrete interfaces
+    that want slotted instances must declare their own ``__slots__``.
     """
+
+    __slots__ = ("_recv_log_enabled",)
+
     # a string describing the underlying bus and/or channel
     channel_info = "unknown"
     # Log level for received messages
     RECV_LOGGING_LEVEL = 9
+    # Timeout passed to recv() while iterating over the bus; None blocks until
+    # a message arrives, a number of seconds lets the loop wake up periodically
+    ITER_RECV_TIMEOUT: Optional[float] = None
 
     @abstractmethod
     def __init__(
@@ -36,7 +45,16 @@ class BusABC(metaclass=ABCMeta):
         :param channel: The channel to use for the bus. Can be an integer, a sequence of integers, or a string.
         :param kwargs: Additional keyword arguments.
         """
-        pass
+        # Whether received messages are logged; the logger level is sampled
+        # once here (or on the first recv() if a subclass skips this call),
+        # call refresh_recv_logging() after reconfiguring logging
+        self.refresh_recv_logging()
+
+    def refresh_recv_logging(self) -> None:
+        """
+        Re-read whether :attr:`RECV_LOGGING_LEVEL` is enabled for the module logger.
+        """
+        self._recv_log_enabled = LOG.isEnabledFor(self.RECV_LOGGING_LEVEL)
 
     def __str__(self) -> str:
         """
@@ -53,7 +71,26 @@ class BusABC(metaclass=ABCMeta):
         :param timeout: seconds to wait for a message or None to wait indefinitely
         :return: :obj:`None` on timeout
         """
-        start = time()
+        try:
+            log_enabled = self._recv_log_enabled
+        except AttributeError:
+            # Sampled lazily for subclasses that do not call BusABC.__init__()
+            self.refresh_recv_logging()
+            log_enabled = self._recv_log_enabled
+
+        # without a timeout, try indefinitely
+        if timeout is None:
+            while True:
+                # try to get a message
+                msg, already_filtered = self._recv_internal(timeout=None)
+
+                # return it, if it matches
+                if msg:
+                    if log_enabled:
+                        LOG.log(self.RECV_LOGGING_LEVEL, "Received: %s", msg)
+                    return msg
+
+        deadline = monotonic() + timeout
         time_left = timeout
 
         while True:
@@ -62,21 +99,15 @@ class BusABC(metaclass=ABCMeta):
 
             # return it, if it matches
             if msg:
-                LOG.log(self.RECV_LOGGING_LEVEL, "Received: %s", msg)
+                if log_enabled:
+                    LOG.log(self.RECV_LOGGING_LEVEL, "Received: %s", msg)
                 return msg
 
-            # if not, and timeout is None, try indefinitely
-            elif timeout is None:
-                continue
-
             # try next one only if there still is time, and with
             # reduced timeout
-            else:
-                time_left = timeout - (time() - start)
-
-                if time_left > 0:
-                    continue
+            time_left = deadline - monotonic()
 
+            if time_left <= 0:
                 return None
 
     def _recv_internal(
@@ -118,7 +149,7 @@ class BusABC(metaclass=ABCMeta):
         :return: An iterator that yields messages received from the bus.
         """
         while True:
-            msg = self.recv(timeout=1.0)
+            msg = self.recv(timeout=self.ITER_RECV_TIMEOUT)
             if msg is not None:
                 yield msg
 
@@ -1,62 +1,16 @@
 """LIN Bus Interface Module
 
 This module provides the core implementation for LIN (Local Interconnect Network) bus interfaces.
-It includes the base implementation of BusABC class and a dynamic backend loading system
-that allows different LIN hardware interfaces to be used interchangeably.
+It includes the :class:`LinBus` factory, which uses the backend registry in
+:mod:`linbus._registry` so that different LIN hardware interfaces can be used interchangeably.
 """
-import importlib
-from typing import *
+import logging
+from typing import Any, Optional, Sequence, Union, cast
 from .bus import BusABC
-from .vector.exceptions import InterfaceNotImplementedError
+from ._registry import BACKENDS, InterfaceNotImplementedError, _get_class_for_interface
 
-# Dictionary mapping interface names to their corresponding module and class names
-# Format: interface_name => (module_path, class_name)
-BACKENDS: Dict[str, Tuple[str, str]] = {
-    "vector": ("lin.vector", "VectorLinBus"),
-}
-
-def _get_class_for_interface(interface: str) -> Type[BusABC]:
-    """Dynamically loads and returns the appropriate bus class for the specified interface.
-
-    This function implements a plugin-like system for LIN interfaces by dynamically
-    importing the required module and class based on the interface name.
-
-    Args:
-        interface: Name of the interface to load (must be a key in BACKENDS)
-
-    Returns:
-        The bus class for the specified interface
-
-    Raises:
-        NotImplementedError: If the requested interface is not registered in BACKENDS
-        InterfaceNotImplementedError: If there are problems importing the interface module or class
-    """
-    # Look up the module and class names for the requested interface
-    try:
-        module_name, class_name = BACKENDS[interface]
-    except KeyError:
-        raise NotImplementedError(
-            f"Lin interface '{interface}' not supported"
-        ) from None
-
-    # Dynamically import the interface module
-    try:
-        module = importlib.import_module(module_name)
-    except Exception as e:
-        raise InterfaceNotImplementedError(
-            f"Cannot import module {module_name} for Lin interface '{interface}': {e}"
-        ) from None
-
-    # Get the interface class from the module
-    try:
-        bus_class = getattr(module, class_name)
-    except Exception as e:
-        raise InterfaceNotImplementedError(
-            f"Cannot import class {class_name} from module {module_name} for Lin interface "
-            f"'{interface}': {e}"
-        ) from None
-
-    return cast(Type[BusABC], bus_class)
+# Create a logger for this module
+LOG = logging.getLogger(__name__)
 
 
 class LinBus(BusABC):  # pylint: disable=abstract-method
@@ -95,7 +49,7 @@ class LinBus(BusABC):  # pylint: disable=abstract-method
         cls = _get_class_for_interface(interface)
 
         # Create and return an instance of the interface
-        print(f"app_name: {app_name}, channel: {channel}, kwargs: {kwargs}")
+        LOG.debug("app_name=%s channel=%s kwargs=%s", app_name, channel, kwargs)
         bus = cls(app_name = app_name,channel=channel,**kwargs)
 
         return cast(BusABC, bus)
@@ -1,6 +1,5 @@
-from . import vector, bus
+from . import vector
 
 __all__ = [
     'vector',
-    'bus',
 ]
\ No newline at end of file
@@ -2,7 +2,7 @@
 """
 
 __all__ = [
-    "VectorBus",
+    "VectorLinBus",
     "VectorBusParams",
     "VectorChannelConfig",
     "VectorError",
@@ -17,7 +17,7 @@ __all__ = [
 ]
 
 from .linlib import (
-    VectorBus,
+    VectorLinBus,
     VectorBusParams,
     VectorChannelConfig,
     get_channel_configs,
@@ -1,6 +1,6 @@
 """Exception/error declarations for the vector interface."""
 
-from can import CanError, CanInitializationError, CanOperationError
+from can import CanError, CanInitializationError, CanInterfaceNotImplementedError, CanOperationError
 
 
 class VectorError(CanError):
@@ -25,4 +25,8 @@ class VectorInitializationError(VectorError, CanInitializationError):
 class VectorOperationError(VectorError, CanOperationError):
     @staticmethod
     def from_generic(error: VectorError) -> "VectorOperationError":
-        return VectorOperationError(*error._args)
\ No newline at end of file
+        return VectorOperationError(*error._args)
+
+
+class VectorInterfaceNotImplementedError(CanInterfaceNotImplementedError):
+    """The Vector interface is not supported on this platform or the XL API is not loaded."""
@@ -4,14 +4,14 @@ Ctypes wrapper module for Vector Lin Interface on win32/win64 systems.
 
 # Import Standard Python Modules
 # ==============================
+import collections
 import ctypes
 import logging
+import threading
 import time
 import os
-import threading
-import numpy as np
 from types import ModuleType
-from typing import *
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union, cast
 
 # Function to wait for a single object in Windows API
 WaitForSingleObject: Optional[Callable[[int, int], int]]
@@ -27,7 +27,7 @@ except ImportError:
     HAS_EVENTS = False
 
 # Import custom exceptions
-from .exceptions import VectorInterfaceNotImplementedError, VectorError
+from .exceptions import VectorInterfaceNotImplementedError, VectorError, VectorInitializationError
 
 # Import custom classes
 from linbus import (
@@ -55,6 +55,11 @@ except Exception as exc:
 
 
 class VectorLinBus(BusABC):
+    # Maximum number of events fetched from the driver by one xlReceive call
+    RX_BATCH_SIZE = 64
+    # Channel configurations read from the driver, shared by all bus instances
+    _channel_configs_cache: Optional[List["VectorChannelConfig"]] = None
+
     def __init__(
         self,
         channel: Union[int, Sequence[int], str],
@@ -86,12 +91,35 @@ class VectorLinBus(BusABC):
 
         # Keep a reference to the Vector API driver
         self.xldriver = xldriver
-        # Open the Vector API driver
-        self.xldriver.xlOpenDriver()
+        # Open the Vector API driver, shared with other bus instances
+        _open_driver_refcounted()
+        # This bus holds one reference on the driver until shutdown
+        self._holds_driver = True
+        try:
+            self._init_bus(channel, app_name, **kwargs)
+        except BaseException:
+            # Do not keep the driver open for a bus that failed to initialize
+            self._release_driver()
+            raise
 
+    def _init_bus(
+        self,
+        channel: Union[int, Sequence[int], str],
+        app_name: Optional[str],
+        **kwargs: Any,
+    ) -> None:
+        """
+        Set up channels, port and notification once the driver is open.
+
+        :param channel: The channel indexes to create this bus with.
+        :param app_name: Name of application in *Vector Hardware Config*.
+        """
         # Bitrate of the bus
         self.bitrate = kwargs.get("bitrate", 16200)
 
+        # Polling interval in seconds, used when Windows events are not available
+        self.poll_interval = kwargs.get("poll_interval", 0.01)
+
         # Index of the master channel
         self.master_channel_index = kwargs.get("master_channel", None)
 
@@ -114,7 +142,7 @@ class VectorLinBus(BusABC):
             )
 
         # Get channel configurations
-        channel_configs = get_channel_configs()
+        channel_configs = self._get_channel_configs()
 
         # Mask representing all channels
         self.mask = 0
@@ -135,9 +163,15 @@ class VectorLinBus(BusABC):
 
             # Calculate the channel mask
             channel_mask = 1 << channel_index
-            if channel_mask != self.channel_masks.get(i):
+            # Mask reported by the driver while looking up the channel, if any
+            driver_mask = self.channel_masks.get(i)
+            if driver_mask is not None and driver_mask != channel_mask:
                 # Raise an error if the channel mask is inconsistent
-                raise VectorError.from_generic("error,contact wall.e")
+                raise VectorInitializationError(
+                    xldefine.XL_Status.XL_ERR_INVALID_CHANNEL_MASK,
+                    f"channel mask 0x{driver_mask:X} does not match channel index {channel_index}",
+                    "xlGetChannelMask",
+                )
 
             # Store the channel mask
             self.channel_masks[i] = channel_mask
@@ -146,19 +180,16 @@ class VectorLinBus(BusABC):
             # Update the overall channel mask
             self.mask |= channel_mask
 
-        # Information about the channel configuration
-        self.channel_info = "Application {}: {}, {},{},{}".format(
-            app_name,
-            "LIN number: " + str(len(self.channels)),
-            "bitrate:" + str(self.bitrate),
-            ", ".join(f"LIN {ch + 1}" for ch in self.channels),
-            ", ".join(f"Device Interface {di + 1}" for di in self.index_to_channel)
-        )
+        # Channel mask of the master channel, None if no master channel is configured
+        self._master_channel_mask: Optional[int] = self.channel_masks.get(self.master_channel_index)
 
-        # Permission mask for channel access
-        permission_mask = xlclass.XLaccess()
-        # Set mask to request channel init permission if needed
-        permission_mask.value = self.mask
+        # Inputs of the channel_info description, formatted on first access
+        self._app_name_str = app_name
+        self._channels_tuple = tuple(self.channels)
+        self._channel_info: Optional[str] = None
+
+        # Permission mask for channel access, requesting init permission for all channels
+        permission_mask = xlclass.XLaccess(self.mask)
 
         # Interface version of the Vector API
         interface_version = xldefine.XL_InterfaceVersion.XL_INTERFACE_VERSION
@@ -167,10 +198,10 @@ class VectorLinBus(BusABC):
         self.port_handle = xlclass.XLportHandle(xldefine.XL_INVALID_PORTHANDLE)
         # Open the port using the Vector API
         self.xldriver.xlOpenPort(
-            self.port_handle,
+            ctypes.byref(self.port_handle),
             self._app_name,
             self.mask,
-            permission_mask,
+            ctypes.byref(permission_mask),
             256,
             interface_version,
             xldefine.XL_BusTypes.XL_BUS_TYPE_LIN,
@@ -185,30 +216,64 @@ class VectorLinBus(BusABC):
             permission_mask.value,
         )
 
-        if self.port_handle == xlclass.XLportHandle(xldefine.XL_INVALID_PORTHANDLE):
+        if self.port_handle.value == xldefine.XL_INVALID_PORTHANDLE:
             # Raise an error if the port cannot be opened
-            raise VectorError.from_generic("error,xlOpenPort fail")
+            raise VectorInitializationError(
+                xldefine.XL_Status.XL_ERR_INVALID_PORT,
+                "invalid port handle",
+                "xlOpenPort",
+            )
 
-        # Initialize channels as master or slave
-        for ch in self.channels:
-            if self.master_channel_index and ch == self.master_channel_index:
-                self.init_master(self.channel_masks[ch])
-            else:
-                self.init_slave(self.channel_masks[ch])
+        # Buffers passed to xlLinSetDLC / xlLinSetSlave, allocated once and reused
+        self._dlc_buf = (ctypes.c_char * 60)()
+        self._slave_buf = (ctypes.c_char * 8)()
+
+        # Initialize the master channel and all other channels as slaves; the XL
+        # API takes channel masks, so each role is configured with one set of calls
+        master_mask = self._master_channel_mask or 0
+        slave_mask = self.mask & ~master_mask
+        if master_mask:
+            self.init_master(master_mask)
+        if slave_mask:
+            self.init_slave(slave_mask)
 
         # Set up event handling if available
         if True:
             # Event handle for receiving notifications
             self.event_handle = xlclass.XLhandle()
             # Set up notification for the port
-            self.xldriver.xlSetNotification(self.port_handle, self.event_handle, 1)
+            self.xldriver.xlSetNotification(self.port_handle, ctypes.byref(self.event_handle), 1)
         else:
             # Log a message if pywin32 is not installed
             LOG.info("Install pywin32 to avoid polling")
 
+        # Event buffer filled by xlReceive, allocated once and reused
+        self._rx_events = (xlclass.XLevent * self.RX_BATCH_SIZE)()
+        # Number of events requested from / delivered by xlReceive
+        self._rx_event_count = ctypes.c_uint(0)
+        # Reference to the event count, built once and passed to every xlReceive call
+        self._rx_event_count_ref = ctypes.byref(self._rx_event_count)
+        # Messages of the last received batch not yet returned to the caller
+        self._rx_queue: Deque[Message] = collections.deque()
+
         # Call the superclass constructor
         super().__init__(channel=channel, **kwargs)
 
+    @property
+    def channel_info(self) -> str:  # type: ignore[override]
+        """
+        Information about the channel configuration.
+        """
+        if self._channel_info is None:
+            channels = self._channels_tuple
+            self._channel_info = (
+                f"Application {self._app_name_str}: LIN number: {len(channels)}, "
+                f"bitrate:{self.bitrate},"
+                f"{', '.join(f'LIN {ch + 1}' for ch in channels)},"
+                f"{', '.join(f'Device Interface {di + 1}' for di in self.index_to_channel)}"
+            )
+        return self._channel_info
+
     def init_master(self, channel_masks: int):
         """
         Initialize a channel as a master.
@@ -245,16 +310,31 @@ class VectorLinBus(BusABC):
 
         :param linID: LIN ID of the request.
         """
-        if self.master_channel_index is None:
+        channel_mask = self._master_channel_mask
+        if channel_mask is None:
             # Raise an error if no master channel is configured
             raise ValueError("No Master Channel")
 
-        for ch in self.channels:
-            if self.master_channel_index and ch == self.master_channel_index:
-                # Send the LIN request using the Vector API
-                xldriver.xlLinSendRequest(self.port_handle, self.channel_masks[ch], linID, 0)
-                isRight = True
-                break
+        # Send the LIN request using the Vector API
+        self.xldriver.xlLinSendRequest(self.port_handle, channel_mask, linID, 0)
+
+    def send_many(self, linIDs: Sequence[int]) -> None:
+        """
+        Send LIN requests for several IDs back to back.
+
+        :param linIDs: LIN IDs of the requests, sent in the given order.
+        """
+        channel_mask = self._master_channel_mask
+        if channel_mask is None:
+            # Raise an error if no master channel is configured
+            raise ValueError("No Master Channel")
+
+        # Bind the driver call and its fixed arguments once for the whole loop
+        send_request = self.xldriver.xlLinSendRequest
+        port_handle = self.port_handle
+        for linID in linIDs:
+            # Send the LIN request using the Vector API
+            send_request(port_handle, channel_mask, linID, 0)
 
     def set_send_msg(self, channel: int, msg: Message, linID: int, is_checksum: bool):
         """
@@ -265,24 +345,17 @@ class VectorLinBus(BusABC):
         :param linID: LIN ID of the message.
         :param is_checksum: Flag indicating if enhanced checksum should be used.
         """
-        isRight = False
+        # Look up the channel mask directly instead of scanning the channel list
+        mask = self.channel_masks.get(channel)
+        if mask is None:
+            # Raise an error if the channel is not found
+            raise ValueError(f"Unknown channel {channel}")
         # Checksum type
         cs = xldefine.XL_LinSetSlave.XL_LIN_CALC_CHECKSUM
         if is_checksum:
             cs = xldefine.XL_LinSetSlave.XL_LIN_CALC_CHECKSUM_ENHANCED
-        for ch in self.channels:
-            if ch == channel:
-                # Get the message data
-                data = msg.data
-                # Get the message data length code
-                dlc = msg.dlc
-                # Set the slave message using the Vector API
-                self._setSlave(self.channel_masks[ch], linID, data, dlc, cs)
-                isRight = True
-                break
-        if not isRight:
-            # Raise an error if the channel is not found
-            raise ValueError("")
+        # Set the slave message using the Vector API
+        self._setSlave(mask, linID, msg.data, msg.dlc, cs)
 
     def _find_global_channel_idx(
         self,
@@ -339,7 +412,7 @@ class VectorLinBus(BusABC):
         channel_mask = self.channel_masks[channel]
 
         # Get the list of channel configurations
-        vcc_list = get_channel_configs()
+        vcc_list = self._get_channel_configs()
         for vcc in vcc_list:
             if vcc.channel_mask == channel_mask:
                 # Return the bus parameters if the channel is found
@@ -350,6 +423,31 @@ class VectorLinBus(BusABC):
             f"Channel configuration for channel {channel} not found."
         )
 
+    @staticmethod
+    def _get_channel_configs() -> List["VectorChannelConfig"]:
+        """
+        Get the channel configurations, reading them from the driver only once.
+
+        :return: List of channel configurations.
+        """
+        configs = VectorLinBus._channel_configs_cache
+        if configs is None:
+            configs = get_channel_configs()
+            # An empty list means the driver could not be read, retry next time
+            if configs:
+                VectorLinBus._channel_configs_cache = configs
+        return configs
+
+    @staticmethod
+    def invalidate_channel_cache() -> None:
+        """
+        Discard the cached channel configurations.
+
+        Call this after plugging or unplugging Vector hardware so the next bus
+        reads the channel configuration from the driver again.
+        """
+        VectorLinBus._channel_configs_cache = None
+
     def _set_dlc(self, channel_masks: int, len: int) -> None:
         """
         Set the data length code for a channel.
@@ -357,30 +455,30 @@ class VectorLinBus(BusABC):
         :param channel_masks: Channel mask.
         :param len: Data length code.
         """
-        # Create a ctypes array for the data length code
-        dlc = (ctypes.c_char * 60)(*(len for i in range(60)))
+        # Fill the data length code array for all 60 IDs in one call
+        dlc = self._dlc_buf
+        ctypes.memset(dlc, len & 0xFF, ctypes.sizeof(dlc))
         # Set the data length code using the Vector API
         self.xldriver.xlLinSetDLC(self.port_handle, channel_masks, dlc)
 
-    def _setSlave(self, channel_masks: int, linID: int, data: bytes, len: int, checksum: xldefine.XL_LinSetSlave) -> None:
+    def _setSlave(self, channel_masks: int, linID: int, data: bytes, dlc: int, checksum: xldefine.XL_LinSetSlave) -> None:
         """
         Set the slave message.
 
         :param channel_masks: Channel mask.
         :param linID: LIN ID of the message.
         :param data: Message data.
-        :param len: Data length.
+        :param dlc: Data length.
         :param checksum: Checksum type.
         """
-        # Create a ctypes array for the message data
-        p = (ctypes.c_char * 8)()
-        n = 0
-        for i, v in enumerate(data):
-            p[i] = v
-
-        t = p
+        # Clear bytes left over from a previous message, then copy the
+        # message data into the slave buffer in one call
+        p = self._slave_buf
+        data = bytes(data)
+        ctypes.memset(p, 0, 8)
+        ctypes.memmove(p, data, min(len(data), 8))
         # Set the slave message using the Vector API
-        self.xldriver.xlLinSetSlave(self.port_handle, channel_masks, linID, t, len, checksum)
+        self.xldriver.xlLinSetSlave(self.port_handle, channel_masks, linID, p, dlc, checksum)
 
     def _active_channel(self, channel_masks: int):
         """
@@ -427,15 +525,6 @@ class VectorLinBus(BusABC):
         # Log the bitrate setting
         LOG.info("xlLinSetChannelParams: baudr.=%u ", bitrate)
 
-    def recv(self, timeout: Optional[float]):
-        """
-        Receive a message from the bus.
-
-        :param timeout: Timeout value in seconds.
-        """
-        # Call the internal receive method
-        self._recv_internal(timeout)
-
     def _recv_internal(
         self, timeout: Optional[float]
     ) -> Tuple[Optional[Message], bool]:
@@ -445,90 +534,164 @@ class VectorLinBus(BusABC):
         :param timeout: Timeout value in seconds.
         :return: Tuple containing the received message and a flag indicating if the message is filtered.
         """
-        # Calculate the end time if a timeout is specified
-        end_time = time.time() + timeout if timeout is not None else None
+        msgs = self._recv_many(timeout, max_msgs=1)
+        return (msgs[0] if msgs else None), False
+
+    def _recv_many(
+        self, timeout: Optional[float], max_msgs: int = 256
+    ) -> List[Message]:
+        """
+        Receive all pending messages from the bus, up to a maximum number.
+
+        Messages left queued by a previous call are served first, then more
+        events are fetched from the driver, without waiting, until ``max_msgs``
+        messages are available or the driver has no more pending events.
+        Messages beyond ``max_msgs`` stay queued for the next call.
+
+        :param timeout: Timeout value in seconds to wait for the first message.
+        :param max_msgs: Maximum number of messages to return.
+        :return: List of received messages, empty if the timeout expired.
+        """
+        # Calculate the end time in nanoseconds of the monotonic clock if a timeout is specified
+        end_time_ns = None if timeout is None else time.monotonic_ns() + int(timeout * 1_000_000_000)
+        # Messages already received by a previous batch
+        rx_queue = self._rx_queue
+        # Bind everything the polling loop needs to locals
+        recv_lin = self._recv_lin
+        now_ns = time.monotonic_ns
+        batch_size = self.RX_BATCH_SIZE
+        queue_is_empty = xldefine.XL_Status.XL_ERR_QUEUE_IS_EMPTY
+        wait = WaitForSingleObject
+        event_handle = self.event_handle.value
+        poll_interval = self.poll_interval
+        # Set once the driver reported that no more events are pending
+        drained = False
 
         while True:
-            try:
-                # Receive a LIN message
-                msg = self._recv_lin()
-            except VectorError as exception:
-                if exception.error_code != xldefine.XL_Status.XL_ERR_QUEUE_IS_EMPTY:
-                    # Raise the error if it is not an empty queue error
-                    raise
-            else:
-                pass
-                # if msg:
-                #     return msg, self._is_filtered
+            # Serve pending messages before calling into the driver again
+            if not rx_queue:
+                try:
+                    # Receive a batch of LIN events
+                    event_count = recv_lin()
+                except VectorError as exception:
+                    if exception.error_code != queue_is_empty:
+                        # Raise the error if it is not an empty queue error
+                        raise
+                    drained = True
+                else:
+                    # A full buffer means more events may be pending
+                    drained = event_count < batch_size
+                    if not rx_queue and not drained:
+                        continue
+
+            if rx_queue:
+                break
 
             # Check if the timeout has expired
-            if end_time is not None and time.time() > end_time:
-                return None
+            if end_time_ns is not None and now_ns() > end_time_ns:
+                return []
 
             if HAS_EVENTS:
                 # Wait for receive event to occur
-                if end_time is None:
+                if end_time_ns is None:
                     time_left_ms = INFINITE
                 else:
-                    time_left = end_time - time.time()
-                    time_left_ms = max(0, int(time_left * 1000))
+                    time_left_ms = max(0, (end_time_ns - now_ns()) // 1_000_000)
                 # Wait for the event using the Windows API
-                WaitForSingleObject(self.event_handle.value, time_left_ms)  # type: ignore
+                wait(event_handle, time_left_ms)  # type: ignore
             else:
                 # Wait a short time until we try again
-                time.sleep(self.poll_interval)
+                time.sleep(poll_interval)
 
-    def _recv_lin(self) -> Optional[Message]:
+        # Top up from the driver without waiting while fewer than max_msgs are queued
+        while not drained and len(rx_queue) < max_msgs:
+            try:
+                drained = recv_lin() < batch_size
+            except VectorError as exception:
+                if exception.error_code != queue_is_empty:
+                    # Raise the error if it is not an empty queue error
+                    raise
+                drained = True
+
+        # Hand out up to max_msgs of the queued messages
+        if len(rx_queue) <= max_msgs:
+            msgs = list(rx_queue)
+            rx_queue.clear()
+        else:
+            popleft = rx_queue.popleft
+            msgs = [popleft() for _ in range(max_msgs)]
+        return msgs
+
+    def _recv_lin(self) -> int:
         """
-        Receive a LIN message.
+        Receive a batch of LIN events.
+
+        LIN messages are appended to the receive queue, all other events are
+        passed to :meth:`handle_lin_event`.
 
-        :return: Received LIN message or None if no message is received.
+        :return: Number of events delivered by the driver.
         """
-        # Structure for a LIN event
-        xl_event = xlclass.XLevent()
-        # Number of events to receive
-        event_count = ctypes.c_uint(1)
-        # Receive an event using the Vector API
-        self.xldriver.xlReceive(self.port_handle, event_count, xl_event)
-
-        # Log the LIN tag and channel index
-        LOG.debug('lin tag{} channel idx {}'.format(xl_event.tag, xl_event.chanIndex))
-
-        if xl_event.tag != xldefine.XL_EventTags.XL_LIN_MSG:
-            # Handle the LIN event if it is not a LIN message
-            self.handle_lin_event(xl_event)
-            return None
-
-        # Message type string
-        ts = "RX: "
-        if xl_event.tagData.linMsgApi.linMsg.flags & xldefine.XL_MessageFlags.XL_LIN_MSGFLAG_TX:
-            ts = "TX: "
-        elif xl_event.tagData.linMsgApi.linMsg.flags & xldefine.XL_MessageFlags.XL_LIN_MSGFLAG_CRCERROR:
-            ts = "CRCERROR"
-        else:
-            ts = "RX:"
+        # Event buffer and number of events to receive
+        events = self._rx_events
+        event_count = self._rx_event_count
+        event_count.value = self.RX_BATCH_SIZE
+        # Receive up to RX_BATCH_SIZE events using the Vector API
+        self.xldriver.xlReceive(self.port_handle, self._rx_event_count_ref, events)
+
+        # Bind everything the event loop needs to locals
+        count = event_count.value
+        lin_msg_tag = xldefine.XL_EventTags.XL_LIN_MSG
+        parse_lin_event = self._parse_lin_event
+        handle_lin_event = self.handle_lin_event
+        append = self._rx_queue.append
+        debug = LOG.isEnabledFor(logging.DEBUG)
+
+        for i in range(count):
+            xl_event = events[i]
+
+            if debug:
+                # Log the LIN tag and channel index
+                LOG.debug("lin tag%s channel idx %s", xl_event.tag, xl_event.chanIndex)
+
+            if xl_event.tag != lin_msg_tag:
+                # Handle the LIN event if it is not a LIN message
+                handle_lin_event(xl_event)
+            else:
+                append(parse_lin_event(xl_event))
+        return count
+
+    def _parse_lin_event(self, xl_event: xlclass.XLevent) -> Message:
+        """
+        Convert a received LIN message event into a Message.
+
+        :param xl_event: Event delivered by xlReceive with the tag XL_LIN_MSG.
+        :return: Received LIN message.
+        """
+        # LIN message part of the event
+        lin_msg = xl_event.tagData.linMsgApi.linMsg
 
-        # Message ID
-        msg_id = xl_event.tagData.linMsgApi.linMsg.id
         # Data length code
-        dlc = xl_event.tagData.linMsgApi.linMsg.dlc
+        dlc = lin_msg.dlc
         # Timestamp
         timestamp = xl_event.timeStamp * 1e-9
-        # Message data
-        data = xl_event.tagData.linMsgApi.linMsg.data[:dlc]
+        # Message data, copied out of the event buffer as bytes in one call
+        data = ctypes.string_at(ctypes.addressof(lin_msg.data), min(dlc, 8))
         # Channel index
         # channel = self.index_to_channel.get(xl_event.chanIndex)
 
-        # Print the received message information
-        print(ts + ":" + str(hex(msg_id)) + "  data:" + str([hex(i) for i in data]))
+        if LOG.isEnabledFor(logging.DEBUG):
+            # Message type string
+            if lin_msg.flags & xldefine.XL_MessageFlags.XL_LIN_MSGFLAG_TX:
+                ts = "TX"
+            elif lin_msg.flags & xldefine.XL_MessageFlags.XL_LIN_MSGFLAG_CRCERROR:
+                ts = "CRCERROR"
+            else:
+                ts = "RX"
+            # Log the received message information
+            LOG.debug("%s: 0x%X  data: %s", ts, lin_msg.id, " ".join("%02X" % b for b in data))
 
-        # Return a Message object
-        return Message(
-            timestamp=timestamp,
-            # arbitration_id=msg_id & 0x1FFFFFFF,
-            dlc=dlc,
-            data=data
-        )
+        # Return a Message object, the parts are already known to be valid
+        return Message._from_parts(timestamp, bytearray(data), dlc)
 
     def handle_lin_event(self, event: xlclass.XLevent) -> None:
         """
@@ -576,7 +739,12 @@ class VectorLinBus(BusABC):
         xl_event.tagData.msg.id = msg_id
         xl_event.tagData.msg.dlc = msg.dlc
         xl_event.tagData.msg.flags = flags
-        xl_event.tagData.msg.data = tuple(msg.data)
+        data = bytes(msg.data)
+        ctypes.memmove(
+            ctypes.addressof(xl_event.tagData.msg.data),
+            data,
+            min(len(data), xldefine.MAX_MSG_LEN),
+        )
 
         return xl_event
 
@@ -593,12 +761,25 @@ class VectorLinBus(BusABC):
         """
         # Call the superclass shutdown method
         super().shutdown()
-        # Deactivate the channels using the Vector API
-        self.xldriver.xlDeactivateChannel(self.port_handle, self.mask)
-        # Close the port using the Vector API
-        self.xldriver.xlClosePort(self.port_handle)
-        # Close the driver using the Vector API
-        self.xldriver.xlCloseDriver()
+        if not self._holds_driver:
+            # Already shut down, the port is closed and the driver released
+            return
+        try:
+            # Deactivate the channels using the Vector API
+            self.xldriver.xlDeactivateChannel(self.port_handle, self.mask)
+            # Close the port using the Vector API
+            self.xldriver.xlClosePort(self.port_handle)
+        finally:
+            # Release this bus's reference on the Vector API driver
+            self._release_driver()
+
+    def _release_driver(self) -> None:
+        """
+        Release this bus's reference on the Vector API driver, at most once.
+        """
+        if self._holds_driver:
+            self._holds_driver = False
+            _close_driver_refcounted()
 
     def reset(self) -> None:
         """
@@ -662,9 +843,9 @@ class VectorLinBus(BusABC):
             xldriver.xlGetApplConfig(
                 app_name.encode(),
                 _app_channel,
-                hw_type,
-                hw_index,
-                hw_channel,
+                ctypes.byref(hw_type),
+                ctypes.byref(hw_index),
+                ctypes.byref(hw_channel),
                 xldefine.XL_BusTypes.XL_BUS_TYPE_LIN,
             )
         except VectorError as e:
@@ -792,6 +973,43 @@ class VectorChannelConfig(NamedTuple):
     transceiver_name: str
 
 
+# Number of users currently holding the Vector API driver open
+_driver_open_count = 0
+# Lock protecting the driver open count
+_driver_open_lock = threading.Lock()
+
+
+def _open_driver_refcounted() -> None:
+    """
+    Open the Vector XL driver unless it is already held open.
+
+    Only the first user calls ``xlOpenDriver``; later calls just count up.
+    Each call must be paired with :func:`_close_driver_refcounted`.
+    """
+    global _driver_open_count
+    with _driver_open_lock:
+        if _driver_open_count == 0:
+            # Open the driver using the Vector API
+            xldriver.xlOpenDriver()  # type: ignore
+        _driver_open_count += 1
+
+
+def _close_driver_refcounted() -> None:
+    """
+    Release one reference on the Vector XL driver.
+
+    ``xlCloseDriver`` is only called when the last user releases it.
+    """
+    global _driver_open_count
+    with _driver_open_lock:
+        if _driver_open_count == 0:
+            return
+        _driver_open_count -= 1
+        if _driver_open_count == 0:
+            # Close the driver using the Vector API
+            xldriver.xlCloseDriver()  # type: ignore
+
+
 def _get_xl_driver_config() -> xlclass.XLdriverConfig:
     """
     Get the Vector XL driver configuration.
@@ -807,12 +1025,14 @@ def _get_xl_driver_config() -> xlclass.XLdriverConfig:
         )
     # Create a driver configuration object
     driver_config = xlclass.XLdriverConfig()
-    # Open the driver using the Vector API
-    xldriver.xlOpenDriver()
-    # Get the driver configuration using the Vector API
-    xldriver.xlGetDriverConfig(driver_config)
-    # Close the driver using the Vector API
-    xldriver.xlCloseDriver()
+    # Hold the driver open, reusing the handle of an open bus if there is one
+    _open_driver_refcounted()
+    try:
+        # Get the driver configuration using the Vector API
+        xldriver.xlGetDriverConfig(ctypes.byref(driver_config))
+    finally:
+        # Release the driver again
+        _close_driver_refcounted()
     return driver_config
 
 
@@ -209,8 +209,8 @@ xlCanSetChannelParamsC200.argtypes = [
     ctypes.c_ubyte,
     ctypes.c_ubyte,
 ]
-xlCanSetChannelParams.restype = xlclass.XLstatus
-xlCanSetChannelParams.errcheck = check_status_initialization
+xlCanSetChannelParamsC200.restype = xlclass.XLstatus
+xlCanSetChannelParamsC200.errcheck = check_status_initialization
 
 xlCanTransmit = _xlapi_dll.xlCanTransmit
 xlCanTransmit.argtypes = [
@@ -390,16 +390,3 @@ xlLinSetDLC.argtypes = [
 xlLinSetDLC.restype = xlclass.XLstatus
 # Set the error checking function for the xlLinSetDLC function
 xlLinSetDLC.errcheck = check_status_operation
-
-# Wrap the xlReceive function from the DLL
-xlReceive = _xlapi_dll.xlReceive
-# Define the argument types for the xlReceive function
-xlReceive.argtypes = [
-    xlclass.XLportHandle,
-    ctypes.POINTER(ctypes.c_uint),
-    ctypes.POINTER(xlclass.XLevent),
-]
-# Define the return type for the xlReceive function
-xlReceive.restype = xlclass.XLstatus
-# Set the error checking function for the xlReceive function
-xlReceive.errcheck = check_status_operation
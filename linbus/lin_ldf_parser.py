@@ -1,6 +1,7 @@
-from typing import List, Dict, Any
-from linbus.message import LINPDU # Assuming LINPDU can help with PID calculation
+import sys
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
 from linbus.lin_master import LinFrameSlot, MasterFrameTableItem, LinFrameType
+from linbus._pid import pid_of
 
 # Placeholder for your LDF parsing result structure
 # This would typically be a more complex object or dictionary
@@ -21,6 +22,9 @@ from linbus.lin_master import LinFrameSlot, MasterFrameTableItem, LinFrameType
 #     }
 # }
 
+# (pid, frame type, data length, delay in ms) of one schedule slot
+_SlotParams = Tuple[int, int, int, int]
+
 class LdfScheduleBuilder:
     def __init__(self, ldf_data: Dict[str, Any], master_node_name: str):
         """
@@ -32,88 +36,149 @@ class LdfScheduleBuilder:
             master_node_name: The name of the LIN master node as defined in the LDF.
         """
         self.ldf_data = ldf_data
-        self.master_node_name = master_node_name
+        # Interned, so the publisher comparisons below mostly reduce to identity checks
+        self.master_node_name = sys.intern(master_node_name)
         self.frames_map = self._build_frames_map()
+        self._frame_records = self._build_frame_records()
+        # Resolved (pid, frame type, data length, delay) per slot, keyed by schedule table name
+        self._schedule_cache: Dict[str, Tuple[_SlotParams, ...]] = {}
 
     def _build_frames_map(self) -> Dict[str, Dict[str, Any]]:
-        """Helper to create a quick lookup map for frames by name."""
-        frames_map = {}
-        if "frames" in self.ldf_data:
-            for frame_name, frame_details in self.ldf_data["frames"].items():
-                frames_map[frame_name] = frame_details
-                # LDF might store ID as int, ensure it's used consistently
-                # Also, LDF usually gives Frame ID, not Protected ID (PID)
-                # PID calculation would be needed.
-        return frames_map
-
-    def _calculate_pid(self, frame_id: int) -> int:
+        """
+        Helper to create a quick lookup map for frames by name.
+
+        The LDF frames dict already maps names to frame details, so it is
+        referenced directly instead of being copied. LDF usually gives the
+        Frame ID, not the Protected ID (PID); PIDs are resolved in
+        _build_frame_records.
+        """
+        return self.ldf_data.get("frames", {})
+
+    def _build_frame_records(self) -> Dict[str, Optional[Tuple[int, int, int]]]:
+        """
+        Precomputes everything build_schedule_table needs per frame.
+
+        Returns:
+            A dict mapping frame name to (pid, frame_type, data_length),
+            or to None if the LDF frame definition is incomplete.
+        """
+        frame_records: Dict[str, Optional[Tuple[int, int, int]]] = {}
+        for frame_name, frame_info in self.frames_map.items():
+            # Frame and node names repeat across frames and schedules, keep one copy each
+            frame_name = sys.intern(frame_name)
+            frame_id = frame_info.get("id")
+            data_length = frame_info.get("length")
+            publisher_node = frame_info.get("publisher")
+
+            if frame_id is None or data_length is None or publisher_node is None:
+                frame_records[frame_name] = None
+                continue
+            publisher_node = sys.intern(publisher_node)
+
+            # Determine frame type from Master's perspective
+            if publisher_node == self.master_node_name:
+                frame_type = LinFrameType.TRANSMIT
+            else:
+                frame_type = LinFrameType.RECEIVE
+
+            frame_records[frame_name] = (
+                self._calculate_pid(frame_id),
+                frame_type,
+                data_length
+            )
+        return frame_records
+
+    @staticmethod
+    def _calculate_pid(frame_id: int) -> int:
         """
         Calculates the Protected ID (PID) from a given Frame ID.
-        This is a placeholder. You'd use a proper LIN PID calculation here,
-        potentially from the LINPDU class or a utility function.
-        Example: P0=ID0^ID1^ID2^ID4, P1=~(ID1^ID3^ID4^ID5)
+        P0=ID0^ID1^ID2^ID4, P1=~(ID1^ID3^ID4^ID5)
         PID = FrameID | (P0<<6) | (P1<<7)
+
+        The parity bits are looked up in a precomputed table; only the lower
+        6 bits of frame_id are used.
         """
-        # Simplified placeholder - replace with actual PID calculation logic
-        # For example, using a utility or the LINPDU class if available
-        # return LINPDU(frame_id=frame_id).Pid # If LINPDU handles this
-        
-        # Basic placeholder logic (NOT LIN COMPLIANT - FOR ILLUSTRATION ONLY)
-        p0 = (frame_id & 0x01) ^ ((frame_id >> 1) & 0x01) ^ ((frame_id >> 2) & 0x01) ^ ((frame_id >> 4) & 0x01)
-        p1 = ~(((frame_id >> 1) & 0x01) ^ ((frame_id >> 3) & 0x01) ^ ((frame_id >> 4) & 0x01) ^ ((frame_id >> 5) & 0x01)) & 0x01
-        return frame_id | (p0 << 6) | (p1 << 7)
+        return pid_of(frame_id)
 
-    def build_schedule_table(self, schedule_table_name: str, default_response_wait_ms: int = 50) -> List[MasterFrameTableItem]:
+    def build_schedule_table(self, schedule_table_name: str, default_response_wait_ms: int = 50) -> Tuple[MasterFrameTableItem, ...]:
         """
         Builds a LIN Master schedule table from the LDF data.
 
+        The immutable per-slot parameters are resolved once per table name and
+        cached; every call builds fresh LinFrameSlot and MasterFrameTableItem
+        objects from them, so tables never share mutable slot state.
+
         Args:
             schedule_table_name: The name of the schedule table to build (e.g., "Table1").
             default_response_wait_ms: Default wait time for slave responses.
 
         Returns:
-            A list of MasterFrameTableItem objects.
-            Returns an empty list if the schedule table is not found or is empty.
+            A tuple of MasterFrameTableItem objects.
+            Returns an empty tuple if the schedule table is not found or is empty.
+        """
+        slot_params = self._schedule_cache.get(schedule_table_name)
+        if slot_params is None:
+            slot_params = tuple(self._iter_slot_params(schedule_table_name))
+            if schedule_table_name in self.ldf_data.get("schedule_tables", {}):
+                self._schedule_cache[schedule_table_name] = slot_params
+        return tuple(self._make_items(slot_params, default_response_wait_ms))
+
+    def iter_schedule_table(self, schedule_table_name: str, default_response_wait_ms: int = 50) -> Iterator[MasterFrameTableItem]:
+        """
+        Yields the LIN Master schedule table items one by one, without building a list.
+
+        Args:
+            schedule_table_name: The name of the schedule table to build (e.g., "Table1").
+            default_response_wait_ms: Default wait time for slave responses.
+
+        Yields:
+            MasterFrameTableItem objects in schedule order.
+            Yields nothing if the schedule table is not found or is empty.
+        """
+        return self._make_items(self._iter_slot_params(schedule_table_name), default_response_wait_ms)
+
+    def _iter_slot_params(self, schedule_table_name: str) -> Iterator[_SlotParams]:
+        """
+        Yields the resolved (pid, frame type, data length, delay) of each schedule slot.
+
+        Slots referring to unknown or incomplete frames are reported and skipped.
         """
-        schedule_items: List[MasterFrameTableItem] = [] 
-        
         if "schedule_tables" not in self.ldf_data or \
            schedule_table_name not in self.ldf_data["schedule_tables"]:
             print(f"Warning: Schedule table '{schedule_table_name}' not found in LDF data.")
-            return schedule_items
+            return
 
         ldf_schedule_slots = self.ldf_data["schedule_tables"][schedule_table_name]
+        frame_records = self._frame_records
 
         for ldf_slot in ldf_schedule_slots:
             frame_name = ldf_slot.get("frame_name") # Or by ID if LDF stores it that way
             delay_ms = ldf_slot.get("delay_ms", 0) # Time offset for this slot
 
-            if not frame_name or frame_name not in self.frames_map:
+            if not frame_name or frame_name not in frame_records:
                 print(f"Warning: Frame '{frame_name}' in schedule table '{schedule_table_name}' not found in LDF frames definition.")
                 continue
 
-            frame_info = self.frames_map[frame_name]
-            frame_id = frame_info.get("id")
-            data_length = frame_info.get("length")
-            publisher_node = frame_info.get("publisher")
-
-            if frame_id is None or data_length is None or publisher_node is None:
+            # PID, frame type and length were resolved once in __init__
+            frame_record = frame_records[frame_name]
+            if frame_record is None:
                 print(f"Warning: Incomplete LDF frame data for '{frame_name}'. Skipping.")
                 continue
-            
-            # Calculate PID from Frame ID
-            # LDF typically provides the 6-bit Frame ID. PID includes parity bits.
-            pid = self._calculate_pid(frame_id) 
+            pid, frame_type, data_length = frame_record
+            yield pid, frame_type, data_length, delay_ms
 
-            # Determine frame type from Master's perspective
-            if publisher_node == self.master_node_name:
-                frame_type = LinFrameType.TRANSMIT
+    @staticmethod
+    def _make_items(slot_params: Iterable[_SlotParams], default_response_wait_ms: int) -> Iterator[MasterFrameTableItem]:
+        """
+        Yields a new MasterFrameTableItem, with its own LinFrameSlot, for each slot parameter tuple.
+        """
+        for pid, frame_type, data_length, delay_ms in slot_params:
+            if frame_type == LinFrameType.TRANSMIT:
                 # For transmit frames, master might need to prepare data. 
                 # LDF signals section would define initial values or how data is composed.
-                # For now, we'll use an empty bytearray.
-                initial_data = bytearray(data_length) 
+                # For now, initialize with zeros. Each TX slot owns its own mutable bytearray.
+                initial_data = bytearray(data_length)
             else:
-                frame_type = LinFrameType.RECEIVE
                 initial_data = None # Master expects to receive this data
             
             lin_frame_slot = LinFrameSlot(
@@ -128,9 +193,7 @@ class LdfScheduleBuilder:
                 offset_ms=delay_ms, # This is the 'delay' from LDF schedule table
                 response_wait_ms=default_response_wait_ms # Configurable, LDF might not specify this directly for master
             )
-            schedule_items.append(master_table_item)
-            
-        return schedule_items
+            yield master_table_item
 
 # Example of how you might use this (conceptual):
 if __name__ == "__main__":
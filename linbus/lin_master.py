@@ -1,5 +1,5 @@
 from enum import Enum
-import time
+from typing import Sequence
 
 class LinMasterState(Enum):
     IDLE = 0
@@ -12,6 +12,13 @@ class LinFrameType:
 
 class LinFrameSlot:
     """LIN frame slot definition, corresponding to C struct open_lin_frame_slot_t"""
+    __slots__ = (
+        "pid",          # Protected Identifier
+        "frame_type",   # LinFrameType.TRANSMIT or LinFrameType.RECEIVE
+        "data_length",  # Data length in bytes
+        "data"          # Frame data buffer
+    )
+
     def __init__(self, pid: int, frame_type: int, data_length: int, data: bytearray = None):
         """Initialize LIN frame slot
         
@@ -28,6 +35,12 @@ class LinFrameSlot:
 
 class MasterFrameTableItem:
     """LIN master schedule table item, corresponding to C struct t_master_frame_table_item"""
+    __slots__ = (
+        "slot",             # Frame slot
+        "offset_ms",        # Time offset (milliseconds)
+        "response_wait_ms"  # Response wait time (milliseconds)
+    )
+
     def __init__(self, slot: LinFrameSlot, offset_ms: int, response_wait_ms: int):
         """Initialize schedule table item
         
@@ -41,13 +54,33 @@ class MasterFrameTableItem:
         self.response_wait_ms = response_wait_ms
 
 class LinMaster:
-    def __init__(self, frame_table):
+    def __init__(self, frame_table: Sequence[MasterFrameTableItem]):
         self.state = LinMasterState.IDLE
         self.master_table_index = 0
         self.master_frame_table = frame_table
         self.frame_table_size = len(frame_table)
+        # Index wrap mask, only usable when the table size is a power of two
+        n = self.frame_table_size
+        self._mask = n - 1 if n and (n & (n - 1)) == 0 else None
         self.time_since_last_frame = 0
+        # Per-item fields needed every tick: (offset_ms, frame_type, pid, data_length)
+        self._flat = tuple(
+            (item.offset_ms, item.slot.frame_type, item.slot.pid, item.slot.data_length)
+            for item in frame_table
+        )
         self.current_item = None
+
+    @property
+    def current_item(self):
+        """The schedule table item currently being processed"""
+        return self._current_item
+
+    @current_item.setter
+    def current_item(self, item):
+        self._current_item = item
+        self._cur = None if item is None else (
+            item.offset_ms, item.slot.frame_type, item.slot.pid, item.slot.data_length
+        )
         
     def _goto_idle(self, next_item=True):
         self.state = LinMasterState.IDLE
@@ -56,21 +89,23 @@ class LinMaster:
             self._next_item()
 
     def _next_item(self):
-        if self.master_table_index >= self.frame_table_size - 1:
-            self.master_table_index = 0
+        if self._mask is not None:
+            self.master_table_index = (self.master_table_index + 1) & self._mask
         else:
-            self.master_table_index += 1
-        self.current_item = self.master_frame_table[self.master_table_index]
+            self.master_table_index = (self.master_table_index + 1) % self.frame_table_size
+        self._current_item = self.master_frame_table[self.master_table_index]
+        self._cur = self._flat[self.master_table_index]
 
     def handle_timing(self, elapsed_ms):
         self.time_since_last_frame += elapsed_ms
         
-        if self.state == LinMasterState.IDLE and self.current_item:
-            if self.time_since_last_frame >= self.current_item.offset_ms:
+        cur = self._cur
+        if self.state == LinMasterState.IDLE and cur:
+            if self.time_since_last_frame >= cur[0]:
                 self._process_frame()
 
     def _process_frame(self):
-        if self.current_item.slot.frame_type == LinFrameType.TRANSMIT:
+        if self._cur[1] == LinFrameType.TRANSMIT:
             self._transmit_frame()
         else:
             self._prepare_reception()
@@ -101,6 +136,8 @@ class LinMaster:
 
 # # Example usage:
 # if __name__ == "__main__":
+#     import time
+#
 #     frame_table = [
 #         MasterFrameTableItem(
 #             slot={'pid': 0x3C, 'data': bytes([0xA0]+[0]*7), 'frame_type': LinFrameType.TRANSMIT},
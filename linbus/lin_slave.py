@@ -1,6 +1,6 @@
 from enum import Enum, auto
-from typing import Optional
-from .message import LINFrame, LINPDU
+from ._checksum import lin_checksum
+from ._pid import PID_LUT, pid_of
 
 class LINSlaveState(Enum):
     """LIN从机状态枚举"""
@@ -30,11 +30,17 @@ class LINSlave:
         """初始化LIN从机"""
         self.state = LINSlaveState.IDLE
         self.data_count = 0
+        # 接收缓冲区只分配一次, 之后不会重新绑定, reset()只清零data_count
         self.data_buffer = bytearray(self.MAX_FRAME_LENGTH)
+        # 缓冲区视图, 切片不复制数据
+        self._mv = memoryview(self.data_buffer)
         self.current_frame = None
 
     def reset(self):
-        """重置从机状态"""
+        """重置从机状态
+        
+        不重新分配data_buffer, _mv始终指向同一块缓冲区
+        """
         self.state = LINSlaveState.IDLE
         self.data_count = 0
 
@@ -70,21 +76,22 @@ class LINSlave:
         Returns:
             int: 带校验位的PID
         """
-        # TODO: 实现PID校验计算
-        return pid
+        # 查表计算, 只使用低6位帧ID
+        return pid_of(pid)
 
-    def calculate_checksum(self, pid: int, data: bytearray) -> int:
+    def calculate_checksum(self, pid: int, data: bytearray, enhanced: bool = True) -> int:
         """计算校验和
         
         Args:
             pid: 协议ID
             data: 数据内容
+            enhanced: True为增强型校验和(包含PID), False为经典校验和
             
         Returns:
             int: 校验和
         """
-        # TODO: 实现校验和计算
-        return 0
+        # 与LINPDU共用同一校验和实现
+        return lin_checksum(pid, data, enhanced)
 
     def set_lin_frame(self, pid: int) -> bool:
         """设置LIN帧
@@ -117,23 +124,26 @@ class LINSlave:
         Args:
             rx_byte: 接收到的字节
         """
+        # 每个字节都会调用, 先把状态读到局部变量
+        state = self.state
         if self.check_for_break():
-            if self.state != LINSlaveState.IDLE:
+            if state != LINSlaveState.IDLE:
                 self.error_handler(LINSlaveError.INVALID_BREAK)
             self.state = LINSlaveState.PID_RX
             self.set_auto_baud()
             return
 
-        if self.state == LINSlaveState.SYNC_RX:
+        if state == LINSlaveState.SYNC_RX:
             if rx_byte != self.SYNCH_BYTE:
                 self.error_handler(LINSlaveError.INVALID_SYNCH)
                 self.reset()
             else:
                 self.state = LINSlaveState.PID_RX
 
-        elif self.state == LINSlaveState.PID_RX:
-            if self.calculate_parity(rx_byte) == rx_byte:
-                pid = rx_byte & self.ID_MASK
+        elif state == LINSlaveState.PID_RX:
+            # 直接查表校验PID, 与calculate_parity等价
+            pid = rx_byte & 0x3F
+            if PID_LUT[pid] == rx_byte:
                 if self.set_lin_frame(pid):
                     if self.state == LINSlaveState.DATA_TX:
                         # TODO: 实现发送数据逻辑
@@ -145,12 +155,13 @@ class LINSlave:
                 self.error_handler(LINSlaveError.PID_PARITY)
                 self.reset()
 
-        elif self.state == LINSlaveState.DATA_RX:
+        elif state == LINSlaveState.DATA_RX:
             if self.data_count < self.current_frame.length:
                 self.data_buffer[self.data_count] = rx_byte
                 self.data_count += 1
             else:
-                checksum = self.calculate_checksum(self.current_frame.pid, self.data_buffer)
+                checksum = self.calculate_checksum(
+                    self.current_frame.pid, self._mv[:self.current_frame.length])
                 if rx_byte == checksum:
                     # TODO: 实现数据接收完成处理
                     pass
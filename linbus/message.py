@@ -2,9 +2,19 @@
 This module contains the implementation of :class:`Message`.
 """
 
-from typing import Optional, Union
-from copy import deepcopy
-from math import isinf, isnan
+import operator
+import struct
+from array import array
+from typing import Iterable, List, Optional, Sequence, Union
+
+from ._checksum import lin_checksum
+from ._pid import PID_LUT, check_pid
+
+# Bit n is set for every valid LIN 2.1 data length n (2, 4 and 8)
+_VALID_DL_MASK = (1 << 2) | (1 << 4) | (1 << 8)
+
+# Zero-filled data templates for each valid data length, copied for empty PDUs
+_ZEROS = {2: bytes(2), 4: bytes(4), 8: bytes(8)}
 
 
 class Message:
@@ -36,17 +46,41 @@ class Message:
             self.data = bytearray()
         elif isinstance(data, bytearray):
             self.data = data
+        elif isinstance(data, (bytes, memoryview)):
+            # Common case, needs no exception handling
+            self.data = bytearray(data)
         else:
+            # Lists and other iterables of ints
             try:
                 self.data = bytearray(data)
             except TypeError as error:
                 err = f"Couldn't create message from {data} ({type(data)})"
                 raise TypeError(err) from error
 
-        if dlc is None:
-            self.dlc = len(self.data)
-        else:
-            self.dlc = dlc
+        self.dlc = len(self.data) if dlc is None else dlc
+
+    @classmethod
+    def _from_parts(cls, timestamp: float, data: bytearray, dlc: int) -> "Message":
+        """
+        Create a message from already validated parts, bypassing :meth:`__init__`.
+
+        For receive paths that build ``data`` as a :class:`bytearray` themselves.
+        The fields are set by :meth:`_init_trusted`.
+        """
+        msg = cls.__new__(cls)
+        msg._init_trusted(timestamp, data, dlc)
+        return msg
+
+    def _init_trusted(self, timestamp: float, data: bytearray, dlc: int) -> None:
+        """
+        Set the message fields without any type checks or conversions.
+
+        For subclasses that already validated their arguments and own
+        ``data`` as a :class:`bytearray`.
+        """
+        self.timestamp = timestamp
+        self.data = data
+        self.dlc = dlc
 
 
 class LINPDU(Message):
@@ -66,7 +100,7 @@ class LINPDU(Message):
         "Sduptr",       # Service Data Unit pointer (actual data bytes)
         "_frame_id",    # Original 6-bit frame identifier
         "_checksum_type", # Checksum type: 'enhanced' or 'classic'
-        "_parity_bits"  # Calculated parity bits for PID
+        "_enhanced"     # True if _checksum_type is 'enhanced'
     )
 
     # LIN 2.1 specification constants
@@ -81,7 +115,8 @@ class LINPDU(Message):
                  DL: int = 8,
                  Sduptr: Union[bytearray, list, bytes] = None,
                  frame_id: Optional[int] = None,
-                 checksum_type: str = 'enhanced'):
+                 checksum_type: str = 'enhanced',
+                 skip_validation: bool = False):
         """
         Initialize a LIN 2.1 PDU.
         
@@ -94,15 +129,35 @@ class LINPDU(Message):
             Sduptr: Service Data Unit data bytes
             frame_id (int): 6-bit frame identifier (0-63)
             checksum_type (str): 'enhanced' or 'classic' checksum
+            skip_validation (bool): Trust Pid and CS as given, e.g. for frames
+                received from the bus. The Pid parity check is skipped and CS is
+                stored as is, even if 0, instead of being calculated. Call
+                validate_pid() and validate_checksum() explicitly when needed.
+        
+        Raises:
+            TypeError: If DL or Drc is not an integer. Integral floats such
+                as 8.0 are rejected too, they cannot index the bit masks below.
+            ValueError: If DL, Drc, checksum_type or the Pid parity is invalid.
         """
-        super().__init__(timestamp)
+        # Message.data and Message.dlc are aliases of Sduptr and DL here,
+        # so Message.__init__ has nothing left to set up
+        self.timestamp = timestamp
+        
+        # Only integers are accepted, the checks below are bit mask tests
+        try:
+            DL = operator.index(DL)
+            Drc = operator.index(Drc)
+        except TypeError:
+            raise TypeError(
+                f"DL and Drc must be integers, got {type(DL).__name__} and {type(Drc).__name__}"
+            ) from None
         
         # Validate data length according to LIN 2.1
-        if DL not in self.VALID_DATA_LENGTHS:
+        if DL < 0 or not (_VALID_DL_MASK >> DL) & 1:
             raise ValueError(f"Invalid data length {DL}. LIN 2.1 supports only {self.VALID_DATA_LENGTHS} bytes")
         
-        # Validate direction
-        if Drc not in (0, 1):
+        # Validate direction, only bit 0 may be set
+        if Drc & ~1:
             raise ValueError("Invalid Direction: 0=Subscribe/Receive, 1=Publish/Transmit")
         
         # Validate checksum type
@@ -112,23 +167,26 @@ class LINPDU(Message):
         self.DL = DL
         self.Drc = Drc
         self._checksum_type = checksum_type
+        self._enhanced = checksum_type == 'enhanced'
         
         # Initialize data
         if Sduptr is None:
-            self.Sduptr = bytearray(DL)  # Initialize with zeros
+            self.Sduptr = bytearray(_ZEROS[DL])  # Initialize with zeros
         elif isinstance(Sduptr, bytearray):
-            self.Sduptr = Sduptr
+            # Keep the caller's bytearray only if no resize is needed,
+            # otherwise resize a copy and leave the caller's buffer untouched
+            self.Sduptr = Sduptr if len(Sduptr) == DL else Sduptr[:DL]
         else:
             self.Sduptr = bytearray(Sduptr)
         
-        # Ensure data length matches DL
+        # Ensure data length matches DL, on a buffer owned by the PDU
         if len(self.Sduptr) != DL:
             if len(self.Sduptr) < DL:
                 # Pad with zeros
-                self.Sduptr.extend([0] * (DL - len(self.Sduptr)))
+                self.Sduptr += bytes(DL - len(self.Sduptr))
             else:
                 # Truncate to DL
-                self.Sduptr = self.Sduptr[:DL]
+                del self.Sduptr[DL:]
         
         # Handle frame ID and PID
         if frame_id is not None:
@@ -139,86 +197,104 @@ class LINPDU(Message):
         else:
             if Pid == 0:
                 raise ValueError("Either Pid or frame_id must be provided")
+            if not skip_validation and not check_pid(Pid):
+                raise ValueError(f"Invalid Pid 0x{Pid:02X}: parity bits do not match the frame ID")
             self.Pid = Pid
             self._frame_id = self._extract_frame_id(Pid)
         
-        # Calculate parity bits
-        self._parity_bits = self._calculate_parity_bits(self._frame_id)
-        
         # Calculate or set checksum
-        if CS == 0:
+        if CS == 0 and not skip_validation:
             self.CS = self._calculate_checksum()
         else:
             self.CS = CS
     
-    def _calculate_pid(self, frame_id: int) -> int:
+    @classmethod
+    def fast_new(cls, timestamp: float, frame_id: int, data: Union[bytearray, bytes]) -> "LINPDU":
+        """
+        Create an 8 byte, enhanced checksum, subscribe PDU without any validation.
+        
+        This is the common case for LIN traffic. The caller must guarantee that
+        frame_id is 0-63 and that data is exactly 8 bytes.
+        
+        Args:
+            timestamp (float): Time when PDU was sent/received
+            frame_id (int): 6-bit frame identifier (0-63)
+            data: 8 data bytes, copied into the PDU
+        """
+        pdu = cls.__new__(cls)
+        pdu.timestamp = timestamp
+        pdu.DL = 8
+        pdu.Drc = 0
+        pdu._checksum_type = 'enhanced'
+        pdu._enhanced = True
+        pdu._frame_id = frame_id
+        pdu.Pid = pid = PID_LUT[frame_id]
+        pdu.Sduptr = sdu = bytearray(data)
+        pdu.CS = lin_checksum(pid, sdu)
+        return pdu
+    
+    @property
+    def data(self) -> bytearray:
+        """Message data, the same object as Sduptr."""
+        return self.Sduptr
+    
+    @property
+    def dlc(self) -> int:
+        """Message data length, the same as DL."""
+        return self.DL
+    
+    @staticmethod
+    def _calculate_pid(frame_id: int) -> int:
         """
         Calculate Protected Identifier from 6-bit frame ID.
         PID = ID[5:0] + P1 + P0
         P0 = ID0 ⊕ ID1 ⊕ ID2 ⊕ ID4
         P1 = ¬(ID1 ⊕ ID3 ⊕ ID4 ⊕ ID5)
         """
-        # Extract individual bits
-        id0 = (frame_id >> 0) & 1
-        id1 = (frame_id >> 1) & 1
-        id2 = (frame_id >> 2) & 1
-        id3 = (frame_id >> 3) & 1
-        id4 = (frame_id >> 4) & 1
-        id5 = (frame_id >> 5) & 1
-        
-        # Calculate parity bits
-        p0 = id0 ^ id1 ^ id2 ^ id4
-        p1 = ~(id1 ^ id3 ^ id4 ^ id5) & 1
-        
-        # Construct PID
-        pid = frame_id | (p0 << 6) | (p1 << 7)
-        return pid
+        # Look up the precomputed PID table shared with the LDF builder and slave
+        return PID_LUT[frame_id]
     
     def _extract_frame_id(self, pid: int) -> int:
         """Extract 6-bit frame ID from PID."""
         return pid & 0x3F
     
-    def _calculate_parity_bits(self, frame_id: int) -> tuple:
-        """Calculate and return parity bits as tuple (P0, P1)."""
-        id0 = (frame_id >> 0) & 1
-        id1 = (frame_id >> 1) & 1
-        id2 = (frame_id >> 2) & 1
-        id3 = (frame_id >> 3) & 1
-        id4 = (frame_id >> 4) & 1
-        id5 = (frame_id >> 5) & 1
-        
-        p0 = id0 ^ id1 ^ id2 ^ id4
-        p1 = ~(id1 ^ id3 ^ id4 ^ id5) & 1
-        
-        return (p0, p1)
-    
     def _calculate_checksum(self) -> int:
         """
         Calculate LIN checksum according to LIN 2.1 specification.
         Enhanced checksum includes PID in calculation.
         Classic checksum only includes data bytes.
         """
-        if self._checksum_type == 'enhanced':
-            # Enhanced checksum includes PID
-            checksum = self.Pid
-        else:
-            # Classic checksum (LIN 1.x compatibility)
-            checksum = 0
+        # Enhanced checksum includes PID, classic checksum (LIN 1.x compatibility) does not
+        return lin_checksum(self.Pid, self.Sduptr, self._enhanced)
+    
+    @staticmethod
+    def batch_checksum(pids: Sequence[int],
+                       data: Sequence[Union[bytes, bytearray, memoryview]],
+                       enhanced: Union[bool, Sequence[int]] = True) -> bytes:
+        """
+        Calculate LIN checksums for many frames in one call.
         
-        # Add all data bytes
-        for byte in self.Sduptr:
-            checksum += byte
-            # Handle carry
-            if checksum > 255:
-                checksum = (checksum & 0xFF) + 1
+        Args:
+            pids: Protected Identifier of each frame
+            data: Data bytes of each frame, in the same order as pids
+            enhanced: True for enhanced checksum, False for classic, or one
+                flag per frame
+        
+        Returns:
+            bytes: One checksum per frame
+        """
+        if len(pids) != len(data):
+            raise ValueError("pids and data must have the same number of frames")
         
-        # Invert checksum
-        return (~checksum) & 0xFF
+        if isinstance(enhanced, bool):
+            return bytes(lin_checksum(pid, sdu, enhanced) for pid, sdu in zip(pids, data))
+        if len(enhanced) != len(pids):
+            raise ValueError("enhanced must have one flag per frame")
+        return bytes(map(lin_checksum, pids, data, enhanced))
     
     def validate_pid(self) -> bool:
         """Validate that PID parity bits are correct."""
-        expected_pid = self._calculate_pid(self._frame_id)
-        return self.Pid == expected_pid
+        return self.Pid == PID_LUT[self._frame_id]
     
     def validate_checksum(self) -> bool:
         """Validate that checksum is correct for current data."""
@@ -235,11 +311,13 @@ class LINPDU(Message):
     
     def get_parity_bits(self) -> tuple:
         """Get parity bits as tuple (P0, P1)."""
-        return self._parity_bits
+        # P0 and P1 are the two top bits of the PID
+        pid = self.Pid
+        return ((pid >> 6) & 1, (pid >> 7) & 1)
     
     def is_enhanced_checksum(self) -> bool:
         """Check if using enhanced checksum."""
-        return self._checksum_type == 'enhanced'
+        return self._enhanced
     
     def set_data(self, data: Union[bytearray, list, bytes]):
         """
@@ -249,16 +327,18 @@ class LINPDU(Message):
             data: New data bytes
         """
         if isinstance(data, bytearray):
-            self.Sduptr = data
+            # Keep the caller's bytearray only if no resize is needed,
+            # otherwise resize a copy and leave the caller's buffer untouched
+            self.Sduptr = data if len(data) == self.DL else data[:self.DL]
         else:
             self.Sduptr = bytearray(data)
         
-        # Ensure data length matches DL
+        # Ensure data length matches DL, on a buffer owned by the PDU
         if len(self.Sduptr) != self.DL:
             if len(self.Sduptr) < self.DL:
-                self.Sduptr.extend([0] * (self.DL - len(self.Sduptr)))
+                self.Sduptr += bytes(self.DL - len(self.Sduptr))
             else:
-                self.Sduptr = self.Sduptr[:self.DL]
+                del self.Sduptr[self.DL:]
         
         # Update checksum
         self.update_checksum()
@@ -269,9 +349,145 @@ class LINPDU(Message):
                 f"pid=0x{self.Pid:02X}, "
                 f"drc={self.Drc}, "
                 f"dl={self.DL}, "
-                f"data={list(self.Sduptr)}, "
+                f"data={self.Sduptr.hex()}, "
                 f"checksum=0x{self.CS:02X}, "
                 f"type={self._checksum_type})")
+    
+    def __str__(self) -> str:
+        """Short one-line summary of LIN PDU."""
+        return f"LINPDU#{self._frame_id:02X}"
+
+
+class LINPDUBatch:
+    """
+    Column-oriented storage for many LIN PDUs, e.g. a recorded bus trace.
+    
+    Each field is kept in one contiguous column instead of one Python object
+    per PDU. The data of PDU ``i`` is ``data[8 * i:8 * i + dl[i]]``, shorter
+    frames are zero padded to 8 bytes. :class:`LINPDU` objects are only
+    created on demand by indexing.
+    """
+    __slots__ = (
+        "timestamps",   # array('d') of timestamps
+        "pids",         # Protected Identifiers
+        "cs",           # Checksums
+        "dl",           # Data lengths
+        "drc",          # Directions
+        "enhanced",     # 1 for enhanced checksum, 0 for classic
+        "data"          # Data bytes, 8 per PDU
+    )
+    
+    STRIDE = 8  # Data bytes stored per PDU
+    # Packed wire record read by from_buffer: timestamp, PID, CS, DL, direction, 8 data bytes
+    RECORD = struct.Struct('<d4B8s')
+    
+    def __init__(self):
+        """Initialize an empty batch."""
+        self.timestamps = array('d')
+        self.pids = bytearray()
+        self.cs = bytearray()
+        self.dl = bytearray()
+        self.drc = bytearray()
+        self.enhanced = bytearray()
+        self.data = bytearray()
+    
+    @classmethod
+    def from_iter(cls, pdus: Iterable[LINPDU]) -> "LINPDUBatch":
+        """
+        Create a batch from LIN PDUs.
+        
+        Args:
+            pdus: LIN PDUs to store, in order
+        """
+        batch = cls()
+        append = batch.append
+        for pdu in pdus:
+            append(pdu)
+        return batch
+    
+    @classmethod
+    def from_buffer(cls, buf: Union[bytes, bytearray, memoryview], enhanced: bool = True) -> "LINPDUBatch":
+        """
+        Create a batch from packed :attr:`RECORD` records without building LIN PDUs.
+        
+        Each 20 byte record is a little-endian double timestamp followed by
+        PID, CS, DL and direction bytes and 8 data bytes, zero padded.
+        
+        Args:
+            buf: Packed records, its length must be a multiple of RECORD.size
+            enhanced (bool): Checksum type of all frames in the buffer
+        """
+        batch = cls()
+        timestamps = batch.timestamps
+        pids = batch.pids
+        cs = batch.cs
+        dl = batch.dl
+        drc = batch.drc
+        data = batch.data
+        for timestamp, pid, checksum, length, direction, sdu in cls.RECORD.iter_unpack(buf):
+            # Same checks as LINPDU.__init__, so every record can be indexed later
+            if not (_VALID_DL_MASK >> length) & 1:
+                raise ValueError(f"Invalid data length {length} in record {len(pids)}")
+            if direction & ~1:
+                raise ValueError(f"Invalid direction {direction} in record {len(pids)}")
+            if pid == 0:
+                raise ValueError(f"Missing Pid in record {len(pids)}")
+            timestamps.append(timestamp)
+            pids.append(pid)
+            cs.append(checksum)
+            dl.append(length)
+            drc.append(direction)
+            data += sdu
+        batch.enhanced = bytearray(b'\x01' if enhanced else b'\x00') * len(pids)
+        return batch
+    
+    def append(self, pdu: LINPDU):
+        """
+        Append one LIN PDU to the batch.
+        
+        Args:
+            pdu: LIN PDU to store
+        """
+        self.timestamps.append(pdu.timestamp)
+        self.pids.append(pdu.Pid)
+        self.cs.append(pdu.CS)
+        self.dl.append(pdu.DL)
+        self.drc.append(pdu.Drc)
+        self.enhanced.append(pdu._enhanced)
+        self.data += pdu.Sduptr
+        self.data += bytes(self.STRIDE - pdu.DL)
+    
+    def __len__(self) -> int:
+        """Number of PDUs in the batch."""
+        return len(self.pids)
+    
+    def __getitem__(self, index: int) -> LINPDU:
+        """Materialize PDU ``index`` as a :class:`LINPDU`, stored values are kept as is."""
+        if index < 0:
+            index += len(self)
+        offset = index * self.STRIDE
+        dl = self.dl[index]
+        return LINPDU(timestamp=self.timestamps[index],
+                      Pid=self.pids[index],
+                      CS=self.cs[index],
+                      Drc=self.drc[index],
+                      DL=dl,
+                      Sduptr=self.data[offset:offset + dl],
+                      checksum_type='enhanced' if self.enhanced[index] else 'classic',
+                      skip_validation=True)
+    
+    def validate_checksums(self) -> List[bool]:
+        """
+        Validate the checksum of every PDU against its data.
+        
+        Returns:
+            list: True for each PDU whose checksum is correct
+        """
+        data = memoryview(self.data)
+        stride = self.STRIDE
+        sdus = [data[offset:offset + dl] for offset, dl in zip(range(0, len(data), stride), self.dl)]
+        expected = LINPDU.batch_checksum(self.pids, sdus, self.enhanced)
+        return [cs == checksum for cs, checksum in zip(self.cs, expected)]
 
 
 class LINFrame(Message):
@@ -301,12 +517,16 @@ class LINFrame(Message):
             data (bytearray): Pointer to frame data bytes
             checksum (int): Frame checksum for error detection
         """
-        super().__init__(timestamp=timestamp, dlc=length, data=data)
+        # Validate frame length
+        if length > 8:
+            raise ValueError("LIN frame data cannot exceed 8 bytes")
+
+        if isinstance(data, bytearray):
+            # Caller already owns a bytearray, skip the generic conversion
+            self._init_trusted(timestamp, data, length)
+        else:
+            super().__init__(timestamp=timestamp, dlc=length, data=data)
 
         self.pid = pid
         self.length = length
         self.checksum = checksum
-
-        # Validate frame length
-        if self.length > 8:
-            raise ValueError("LIN frame data cannot exceed 8 bytes")
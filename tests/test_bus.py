@@ -0,0 +1,57 @@
+"""Tests for the BusABC base class."""
+
+import logging
+import unittest
+
+from linbus.bus import LOG, BusABC
+from linbus.message import Message
+
+
+class _QueueBus(BusABC):
+    """Bus returning queued messages, deliberately without calling BusABC.__init__."""
+
+    def __init__(self, channel, messages=()):
+        self.channel_info = f"queue {channel}"
+        self.messages = list(messages)
+
+    def _recv_internal(self, timeout):
+        return (self.messages.pop(0) if self.messages else None), False
+
+    def send(self, linID):
+        pass
+
+    def set_send_msg(self, channel, msg, linID, is_checksum):
+        pass
+
+
+class TestBusABC(unittest.TestCase):
+    def test_recv_without_base_init(self):
+        msg = Message(data=b"\x01\x02")
+        bus = _QueueBus(0, [msg])
+        self.assertIs(bus.recv(timeout=0), msg)
+        self.assertIsNone(bus.recv(timeout=0))
+
+    def test_recv_logging(self):
+        msg = Message(data=b"\x01")
+        bus = _QueueBus(0, [msg])
+        with self.assertLogs(LOG, level=BusABC.RECV_LOGGING_LEVEL) as logs:
+            self.assertIs(bus.recv(timeout=0), msg)
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(logs.records[0].levelno, BusABC.RECV_LOGGING_LEVEL)
+
+    def test_refresh_recv_logging(self):
+        bus = _QueueBus(0)
+        level = LOG.level
+        try:
+            LOG.setLevel(logging.WARNING)
+            bus.refresh_recv_logging()
+            self.assertFalse(bus._recv_log_enabled)
+            LOG.setLevel(BusABC.RECV_LOGGING_LEVEL)
+            bus.refresh_recv_logging()
+            self.assertTrue(bus._recv_log_enabled)
+        finally:
+            LOG.setLevel(level)
+
+
+if __name__ == "__main__":
+    unittest.main()
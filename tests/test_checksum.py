@@ -0,0 +1,47 @@
+"""Tests for the LIN frame checksum."""
+
+import random
+import unittest
+
+from linbus._checksum import lin_checksum
+
+
+def _reference_checksum(pid, data, enhanced):
+    """Checksum computed byte by byte, subtracting 255 on every carry."""
+    checksum = pid if enhanced else 0
+    for byte in data:
+        checksum += byte
+        if checksum > 0xFF:
+            checksum -= 0xFF
+    return (~checksum) & 0xFF
+
+
+class TestLinChecksum(unittest.TestCase):
+    def test_against_reference(self):
+        rng = random.Random(0)
+        for _ in range(2000):
+            pid = rng.randrange(256)
+            data = bytes(rng.randrange(256) for _ in range(rng.choice((0, 1, 2, 4, 8))))
+            for enhanced in (False, True):
+                with self.subTest(pid=pid, data=data.hex(), enhanced=enhanced):
+                    self.assertEqual(lin_checksum(pid, data, enhanced), _reference_checksum(pid, data, enhanced))
+
+    def test_worst_case_carries(self):
+        data = b"\xff" * 8
+        for enhanced in (False, True):
+            self.assertEqual(lin_checksum(0xFF, data, enhanced), _reference_checksum(0xFF, data, enhanced))
+
+    def test_classic_ignores_pid(self):
+        data = bytes([0x01, 0x02, 0x03, 0x04])
+        self.assertEqual(lin_checksum(0x00, data, False), lin_checksum(0xC1, data, False))
+        self.assertNotEqual(lin_checksum(0x00, data, True), lin_checksum(0xC1, data, True))
+
+    def test_accepts_buffer_types(self):
+        data = bytearray(b"\x10\x20\x30")
+        expected = lin_checksum(0x50, bytes(data))
+        self.assertEqual(lin_checksum(0x50, data), expected)
+        self.assertEqual(lin_checksum(0x50, memoryview(data)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""Smoke tests for the backend registry and the LinBus factory."""
+
+import unittest
+from unittest import mock
+
+import linbus.interface
+from linbus._registry import BACKENDS, InterfaceNotImplementedError, _get_class_for_interface
+from linbus.interfaces.vector import VectorLinBus
+
+
+class TestBackendRegistry(unittest.TestCase):
+    def tearDown(self):
+        _get_class_for_interface.cache_clear()
+
+    def test_resolve_vector(self):
+        self.assertIs(_get_class_for_interface("vector"), VectorLinBus)
+
+    def test_resolve_default_backend(self):
+        self.assertIs(_get_class_for_interface(None), VectorLinBus)
+
+    def test_unknown_interface(self):
+        with self.assertRaises(NotImplementedError):
+            _get_class_for_interface("no-such-interface")
+
+    def test_unimportable_backend(self):
+        BACKENDS["broken"] = "linbus.no_such_module:NoSuchBus"
+        try:
+            with self.assertRaises(InterfaceNotImplementedError):
+                _get_class_for_interface("broken")
+        finally:
+            del BACKENDS["broken"]
+
+    def test_factory_exported(self):
+        self.assertIs(linbus.LinBus, linbus.interface.LinBus)
+        self.assertIs(linbus.InterfaceNotImplementedError, InterfaceNotImplementedError)
+
+
+class TestLinBusFactory(unittest.TestCase):
+    def tearDown(self):
+        _get_class_for_interface.cache_clear()
+
+    def test_creates_vector_bus(self):
+        with mock.patch.object(VectorLinBus, "__init__", return_value=None) as init:
+            bus = linbus.LinBus(channel=0, interface="vector", app_name="test")
+        self.assertIsInstance(bus, VectorLinBus)
+        init.assert_called_once_with(app_name="test", channel=0)
+
+    def test_creates_default_bus(self):
+        with mock.patch.object(VectorLinBus, "__init__", return_value=None):
+            self.assertIsInstance(linbus.LinBus(channel=0), VectorLinBus)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+"""Tests for building LIN master schedule tables from LDF data."""
+
+import unittest
+
+from linbus.lin_ldf_parser import LdfScheduleBuilder
+from linbus.lin_master import LinFrameType
+
+LDF_DATA = {
+    "frames": {
+        "MasterReq": {"id": 0x10, "length": 2, "publisher": "Master"},
+        "MasterCmd": {"id": 0x11, "length": 8, "publisher": "Master"},
+        "SlaveResp": {"id": 0x12, "length": 4, "publisher": "Slave1"},
+    },
+    "schedule_tables": {
+        "Table1": [
+            {"frame_name": "MasterReq", "delay_ms": 10},
+            {"frame_name": "MasterCmd", "delay_ms": 10},
+            {"frame_name": "SlaveResp", "delay_ms": 20},
+        ],
+    },
+}
+
+
+class TestLdfScheduleBuilder(unittest.TestCase):
+    def setUp(self):
+        self.builder = LdfScheduleBuilder(LDF_DATA, "Master")
+
+    def test_slots(self):
+        items = self.builder.build_schedule_table("Table1", default_response_wait_ms=30)
+        self.assertEqual(
+            [(i.slot.pid, i.slot.frame_type, i.slot.data_length, i.offset_ms, i.response_wait_ms) for i in items],
+            [
+                (0x50, LinFrameType.TRANSMIT, 2, 10, 30),
+                (0x11, LinFrameType.TRANSMIT, 8, 10, 30),
+                (0x92, LinFrameType.RECEIVE, 4, 20, 30),
+            ],
+        )
+
+    def test_transmit_slots_own_mutable_data(self):
+        first = self.builder.build_schedule_table("Table1")
+        second = self.builder.build_schedule_table("Table1")
+        self.assertIsInstance(first[0].slot.data, bytearray)
+        self.assertIsNot(first[0].slot, second[0].slot)
+        first[0].slot.data[0] = 0x55
+        self.assertEqual(second[0].slot.data, bytearray(2))
+        self.assertEqual(first[1].slot.data, bytearray(8))
+
+    def test_unknown_table(self):
+        self.assertEqual(self.builder.build_schedule_table("NoSuchTable"), ())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""Tests for the LIN message, PDU and PDU batch classes."""
+
+import struct
+import unittest
+
+from linbus._pid import pid_of
+from linbus.message import LINPDU, LINPDUBatch
+
+
+def _pdus():
+    return [
+        LINPDU(timestamp=1.5, frame_id=0x10, DL=2, Drc=1, Sduptr=b"\x01\x02"),
+        LINPDU(timestamp=2.5, frame_id=0x21, DL=4, Sduptr=b"\xff\xfe\xfd\xfc", checksum_type="classic"),
+        LINPDU(timestamp=3.5, frame_id=0x3C, DL=8, Sduptr=bytes(range(0xF8, 0x100))),
+    ]
+
+
+def _record(timestamp=0.0, pid=None, cs=0, dl=8, drc=0, data=bytes(8)):
+    return LINPDUBatch.RECORD.pack(timestamp, pid_of(0x10) if pid is None else pid, cs, dl, drc, data)
+
+
+class TestLINPDU(unittest.TestCase):
+    def test_valid_lengths(self):
+        for dl in (2, 4, 8):
+            pdu = LINPDU(frame_id=0x10, DL=dl, Drc=1)
+            self.assertEqual((pdu.DL, pdu.Drc, pdu.Sduptr), (dl, 1, bytearray(dl)))
+
+    def test_invalid_values(self):
+        for kwargs in ({"DL": 0}, {"DL": 3}, {"DL": -1}, {"DL": 64}, {"Drc": 2}, {"Drc": -1}):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                LINPDU(frame_id=0x10, **kwargs)
+
+    def test_non_integer_dl_and_drc(self):
+        for kwargs in ({"DL": 8.0}, {"DL": "8"}, {"Drc": 1.0}, {"Drc": None}):
+            with self.subTest(**kwargs), self.assertRaises(TypeError):
+                LINPDU(frame_id=0x10, **kwargs)
+
+
+class TestLINPDUBatch(unittest.TestCase):
+    def assertSamePdu(self, pdu, expected):
+        self.assertEqual(
+            (pdu.timestamp, pdu.Pid, pdu.CS, pdu.DL, pdu.Drc, pdu.Sduptr, pdu._enhanced),
+            (expected.timestamp, expected.Pid, expected.CS, expected.DL, expected.Drc,
+             expected.Sduptr, expected._enhanced),
+        )
+
+    def test_from_iter(self):
+        pdus = _pdus()
+        batch = LINPDUBatch.from_iter(pdus)
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(len(batch.data), 3 * LINPDUBatch.STRIDE)
+        for index, pdu in enumerate(pdus):
+            self.assertSamePdu(batch[index], pdu)
+        self.assertEqual(batch.validate_checksums(), [True, True, True])
+
+    def test_record_round_trip(self):
+        pdus = [pdu for pdu in _pdus() if pdu._enhanced]
+        buf = b"".join(
+            _record(pdu.timestamp, pdu.Pid, pdu.CS, pdu.DL, pdu.Drc, bytes(pdu.Sduptr).ljust(8, b"\x00"))
+            for pdu in pdus
+        )
+        self.assertEqual(len(buf), len(pdus) * LINPDUBatch.RECORD.size)
+        batch = LINPDUBatch.from_buffer(memoryview(buf))
+        self.assertEqual(len(batch), len(pdus))
+        for index, pdu in enumerate(pdus):
+            self.assertSamePdu(batch[index], pdu)
+        self.assertEqual(batch.validate_checksums(), [True] * len(pdus))
+
+    def test_from_buffer_classic(self):
+        pdu = _pdus()[1]
+        buf = _record(pdu.timestamp, pdu.Pid, pdu.CS, pdu.DL, pdu.Drc, bytes(pdu.Sduptr).ljust(8, b"\x00"))
+        batch = LINPDUBatch.from_buffer(buf, enhanced=False)
+        self.assertSamePdu(batch[0], pdu)
+        self.assertEqual(batch.validate_checksums(), [True])
+        self.assertEqual(LINPDUBatch.from_buffer(buf).validate_checksums(), [False])
+
+    def test_validate_checksums_detects_corruption(self):
+        batch = LINPDUBatch.from_iter(_pdus())
+        batch.cs[1] ^= 0x01
+        batch.data[LINPDUBatch.STRIDE * 2] ^= 0x80
+        self.assertEqual(batch.validate_checksums(), [True, False, False])
+
+    def test_from_buffer_rejects_invalid_records(self):
+        for kwargs in ({"dl": 0}, {"dl": 3}, {"dl": 9}, {"drc": 2}, {"drc": 0x81}, {"pid": 0}):
+            with self.subTest(**kwargs):
+                buf = _record(dl=2) + _record(**kwargs)
+                with self.assertRaisesRegex(ValueError, "record 1"):
+                    LINPDUBatch.from_buffer(buf)
+
+    def test_from_buffer_rejects_partial_record(self):
+        with self.assertRaises(struct.error):
+            LINPDUBatch.from_buffer(_record()[:-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+"""Tests for the protected identifier lookup table."""
+
+import unittest
+
+from linbus._pid import PID_LUT, check_pid, pid_of
+
+
+def _reference_pid(frame_id):
+    """Protected ID computed bit by bit as in the LIN 2.1 specification."""
+    bit = [(frame_id >> i) & 1 for i in range(6)]
+    p0 = bit[0] ^ bit[1] ^ bit[2] ^ bit[4]
+    p1 = 1 - (bit[1] ^ bit[3] ^ bit[4] ^ bit[5])
+    return frame_id | (p0 << 6) | (p1 << 7)
+
+
+class TestPid(unittest.TestCase):
+    def test_lut_matches_parity_formula(self):
+        self.assertEqual(len(PID_LUT), 64)
+        for frame_id in range(64):
+            with self.subTest(frame_id=frame_id):
+                self.assertEqual(PID_LUT[frame_id], _reference_pid(frame_id))
+                self.assertEqual(pid_of(frame_id), _reference_pid(frame_id))
+
+    def test_known_pids(self):
+        # Examples from the LIN 2.1 specification, master request and slave response
+        self.assertEqual(pid_of(0x3C), 0x3C)
+        self.assertEqual(pid_of(0x3D), 0x7D)
+
+    def test_pid_of_masks_frame_id(self):
+        self.assertEqual(pid_of(0x40 | 0x12), pid_of(0x12))
+
+    def test_check_pid(self):
+        for frame_id in range(64):
+            pid = _reference_pid(frame_id)
+            with self.subTest(frame_id=frame_id):
+                self.assertTrue(check_pid(pid))
+                self.assertFalse(check_pid(pid ^ 0x40))
+                self.assertFalse(check_pid(pid ^ 0x80))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Tests for the receive queue of the Vector LIN bus, without the XL driver."""
+
+import collections
+import unittest
+from types import SimpleNamespace
+
+from linbus.interfaces.vector import VectorLinBus
+from linbus.message import Message
+
+
+def _make_bus(batches):
+    """Create a bus whose driver delivers ``batches`` of messages, one per xlReceive call."""
+    bus = VectorLinBus.__new__(VectorLinBus)
+    bus._rx_queue = collections.deque()
+    bus.event_handle = SimpleNamespace(value=None)
+    bus.poll_interval = 0.0
+    bus.receive_calls = 0
+    pending = collections.deque(batches)
+
+    def recv_lin():
+        bus.receive_calls += 1
+        batch = pending.popleft() if pending else []
+        bus._rx_queue.extend(batch)
+        return len(batch)
+
+    bus._recv_lin = recv_lin
+    return bus
+
+
+def _messages(count, start=0):
+    return [Message(timestamp=float(i), data=bytes([i & 0xFF])) for i in range(start, start + count)]
+
+
+class TestRecvMany(unittest.TestCase):
+    def test_fetches_full_batches_up_to_max_msgs(self):
+        size = VectorLinBus.RX_BATCH_SIZE
+        bus = _make_bus([_messages(size), _messages(size, size), _messages(3, 2 * size)])
+        msgs = bus._recv_many(timeout=0, max_msgs=2 * size + 3)
+        self.assertEqual([m.timestamp for m in msgs], [float(i) for i in range(2 * size + 3)])
+        self.assertEqual(bus.receive_calls, 3)
+
+    def test_tops_up_queued_messages(self):
+        size = VectorLinBus.RX_BATCH_SIZE
+        bus = _make_bus([_messages(2, 10)])
+        bus._rx_queue.extend(_messages(3))
+        msgs = bus._recv_many(timeout=0, max_msgs=size)
+        self.assertEqual([m.timestamp for m in msgs], [0.0, 1.0, 2.0, 10.0, 11.0])
+        self.assertEqual(bus.receive_calls, 1)
+
+    def test_keeps_messages_beyond_max_msgs(self):
+        bus = _make_bus([_messages(5)])
+        self.assertEqual(len(bus._recv_many(timeout=0, max_msgs=2)), 2)
+        self.assertEqual(len(bus._rx_queue), 3)
+        # The queue already holds enough messages, the driver is not called again
+        self.assertEqual(len(bus._recv_many(timeout=0, max_msgs=1)), 1)
+        self.assertEqual(bus.receive_calls, 1)
+
+    def test_timeout(self):
+        bus = _make_bus([])
+        self.assertEqual(bus._recv_many(timeout=0), [])
+
+
+if __name__ == "__main__":
+    unittest.main()